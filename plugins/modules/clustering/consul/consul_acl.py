@@ -188,7 +188,8 @@ except ImportError:
     has_requests = False
 
 from collections import defaultdict
-from ansible.module_utils.basic import to_text, AnsibleModule
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_text
 
 
 RULE_SCOPES = [
@@ -261,35 +262,46 @@ def set_acl(consul_client, configuration):
     :param configuration: the run configuration
     :return: the output of setting the ACL
     """
-    acls_as_json = decode_acls_as_json(consul_client.acl.list())
-    existing_acls_mapped_by_name = dict((acl.name, acl) for acl in acls_as_json if acl.name is not None)
-    existing_acls_mapped_by_token = dict((acl.token, acl) for acl in acls_as_json)
+    if configuration.token:
+        # Token given so can look up the ACL directly rather than listing all of them
+        existing_acl = get_acl_with_token(consul_client, configuration.token)
+        if existing_acl is not None:
+            return update_acl(consul_client, configuration, existing_acl)
+
+    # Only the ACL that gets updated (if any) needs its rules decoded
+    acls_as_json = consul_client.acl.list()
+    existing_acls_mapped_by_token = dict((acl_as_json[_TOKEN_JSON_PROPERTY], acl_as_json) for acl_as_json in acls_as_json)
     if None in existing_acls_mapped_by_token:
         raise AssertionError("expecting ACL list to be associated to a token: %s" %
                              existing_acls_mapped_by_token[None])
+    existing_tokens_mapped_by_name = dict((acl_as_json[_NAME_JSON_PROPERTY], acl_as_json[_TOKEN_JSON_PROPERTY])
+                                          for acl_as_json in acls_as_json if acl_as_json[_NAME_JSON_PROPERTY] is not None)
 
-    if configuration.token is None and configuration.name and configuration.name in existing_acls_mapped_by_name:
+    if configuration.token is None and configuration.name:
         # No token but name given so can get token from name
-        configuration.token = existing_acls_mapped_by_name[configuration.name].token
+        configuration.token = existing_tokens_mapped_by_name.get(configuration.name)
 
-    if configuration.token and configuration.token in existing_acls_mapped_by_token:
-        return update_acl(consul_client, configuration)
+    existing_acl_as_json = existing_acls_mapped_by_token.get(configuration.token) if configuration.token else None
+    if existing_acl_as_json is not None:
+        return update_acl(consul_client, configuration, decode_acl_as_json(existing_acl_as_json))
     else:
         if configuration.token in existing_acls_mapped_by_token:
             raise AssertionError()
-        if configuration.name in existing_acls_mapped_by_name:
+        if configuration.name in existing_tokens_mapped_by_name:
             raise AssertionError()
         return create_acl(consul_client, configuration)
 
 
-def update_acl(consul_client, configuration):
+def update_acl(consul_client, configuration, existing_acl=None):
     """
     Updates an ACL.
     :param consul_client: the consul client
     :param configuration: the run configuration
+    :param existing_acl: the ACL as currently stored in Consul. Will be loaded if not given
     :return: the output of the update
     """
-    existing_acl = load_acl_with_token(consul_client, configuration.token)
+    if existing_acl is None:
+        existing_acl = load_acl_with_token(consul_client, configuration.token)
     changed = existing_acl.rules != configuration.rules
 
     if changed:
@@ -310,7 +322,7 @@ def create_acl(consul_client, configuration):
     :param configuration: the run configuration
     :return: the output of the creation
     """
-    rules_as_hcl = encode_rules_as_hcl_string(configuration.rules) if len(configuration.rules) > 0 else None
+    rules_as_hcl = encode_rules_as_hcl_string(configuration.rules)
     token = consul_client.acl.create(
         name=configuration.name, type=configuration.token_type, rules=rules_as_hcl, acl_id=configuration.token)
     rules = configuration.rules
@@ -339,9 +351,22 @@ def load_acl_with_token(consul, token):
     :return: the ACL associated to the given token
     :exception ConsulACLTokenNotFoundException: raised if the given token does not exist
     """
+    acl = get_acl_with_token(consul, token)
+    if acl is None:
+        raise ConsulACLNotFoundException(token)
+    return acl
+
+
+def get_acl_with_token(consul, token):
+    """
+    Gets the ACL with the given token (token == rule ID), if it exists.
+    :param consul: the consul client
+    :param token: the ACL "token"/ID (not name)
+    :return: the ACL associated to the given token or `None` if the given token does not exist
+    """
     acl_as_json = consul.acl.info(token)
     if acl_as_json is None:
-        raise ConsulACLNotFoundException(token)
+        return None
     return decode_acl_as_json(acl_as_json)
 
 
@@ -356,10 +381,7 @@ def encode_rules_as_hcl_string(rules):
         # Note: empty string is not valid HCL according to `hcl.load` however, the ACL `Rule` property will be an empty
         # string if there is no rules...
         return None
-    rules_as_hcl = ""
-    for rule in rules:
-        rules_as_hcl += encode_rule_as_hcl_string(rule)
-    return rules_as_hcl
+    return "".join(encode_rule_as_hcl_string(rule) for rule in rules)
 
 
 def encode_rule_as_hcl_string(rule):
@@ -465,15 +487,6 @@ def decode_acl_as_json(acl_as_json):
     )
 
 
-def decode_acls_as_json(acls_as_json):
-    """
-    Converts the given JSON representation of ACLs into a list of ACL domain models.
-    :param acls_as_json: the JSON representation of a collection of ACLs
-    :return: list of equivalent domain models for the given ACLs (order not guaranteed to be the same)
-    """
-    return [decode_acl_as_json(acl_as_json) for acl_as_json in acls_as_json]
-
-
 class ConsulACLNotFoundException(Exception):
     """
     Exception raised if an ACL with is not found.
@@ -516,6 +529,8 @@ class ACL:
     Consul ACL. See: https://www.consul.io/docs/guides/acl.html.
     """
 
+    __slots__ = ("rules", "token_type", "token", "name")
+
     def __init__(self, rules, token_type, token, name):
         self.rules = rules
         self.token_type = token_type
@@ -539,6 +554,8 @@ class Rule:
     ACL rule. See: https://www.consul.io/docs/guides/acl.html#acl-rules-and-scope.
     """
 
+    __slots__ = ("scope", "policy", "pattern")
+
     def __init__(self, scope, policy, pattern=None):
         self.scope = scope
         self.policy = policy
@@ -584,8 +601,9 @@ class RuleCollection:
         return count
 
     def __eq__(self, other):
+        # Rules are keyed by scope and pattern, so comparing the mappings is order-independent
         return isinstance(other, self.__class__) \
-            and set(self) == set(other)
+            and self._rules == other._rules
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -609,7 +627,8 @@ def get_consul_client(configuration):
     """
     Gets a Consul client for the given configuration.
 
-    Does not check if the Consul client can connect.
+    Does not check if the Consul client can connect. The client holds a single HTTP session, so one client should be
+    created per run and shared between calls to reuse the connection to the agent.
     :param configuration: the run configuration
     :return: Consul client
     """
@@ -650,18 +669,11 @@ def main():
     except ImportError as e:
         module.fail_json(msg=str(e))
 
-    configuration = Configuration(
-        management_token=module.params.get(MANAGEMENT_PARAMETER_NAME),
-        host=module.params.get(HOST_PARAMETER_NAME),
-        scheme=module.params.get(SCHEME_PARAMETER_NAME),
-        validate_certs=module.params.get(VALIDATE_CERTS_PARAMETER_NAME),
-        name=module.params.get(NAME_PARAMETER_NAME),
-        port=module.params.get(PORT_PARAMETER_NAME),
-        rules=decode_rules_as_yml(module.params.get(RULES_PARAMETER_NAME)),
-        state=module.params.get(STATE_PARAMETER_NAME),
-        token=module.params.get(TOKEN_PARAMETER_NAME),
-        token_type=module.params.get(TOKEN_TYPE_PARAMETER_NAME)
-    )
+    # Configuration arguments are named after the module parameters, except for the management token
+    configuration_kwargs = dict(module.params)
+    configuration_kwargs["management_token"] = configuration_kwargs.pop(MANAGEMENT_PARAMETER_NAME)
+    configuration_kwargs[RULES_PARAMETER_NAME] = decode_rules_as_yml(configuration_kwargs[RULES_PARAMETER_NAME])
+    configuration = Configuration(**configuration_kwargs)
     consul_client = get_consul_client(configuration)
 
     try:
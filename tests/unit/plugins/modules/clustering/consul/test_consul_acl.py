@@ -0,0 +1,106 @@
+# Copyright (c) Ansible Project
+# GNU General Public License v3.0+ (see LICENSES/GPL-3.0-or-later.txt or https://www.gnu.org/licenses/gpl-3.0.txt)
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import pytest
+
+from ansible_collections.community.general.tests.unit.compat.mock import MagicMock, call
+from ansible_collections.community.general.plugins.modules.clustering.consul.consul_acl import (
+    Configuration, Rule, RuleCollection, set_acl, CLIENT_TOKEN_TYPE_VALUE, CREATE_OPERATION, UPDATE_OPERATION,
+)
+
+
+EXISTING_TOKEN = "existing-token"
+EXISTING_NAME = "existing-name"
+EXISTING_ACL_AS_JSON = {"ID": EXISTING_TOKEN, "Name": EXISTING_NAME, "Type": CLIENT_TOKEN_TYPE_VALUE, "Rules": ""}
+
+
+def _rules(*rules):
+    collection = RuleCollection()
+    for rule in rules:
+        collection.add(rule)
+    return collection
+
+
+@pytest.fixture
+def consul_client():
+    client = MagicMock()
+    client.acl.info.side_effect = lambda token: EXISTING_ACL_AS_JSON if token == EXISTING_TOKEN else None
+    client.acl.list.return_value = [EXISTING_ACL_AS_JSON]
+    client.acl.create.return_value = "new-token"
+    return client
+
+
+def _configuration(**kwargs):
+    return Configuration(rules=RuleCollection(), token_type=CLIENT_TOKEN_TYPE_VALUE, **kwargs)
+
+
+def test_set_acl_with_known_token_only_looks_up_token(consul_client):
+    output = set_acl(consul_client, _configuration(token=EXISTING_TOKEN))
+
+    assert output.operation == UPDATE_OPERATION
+    assert output.changed is False
+    assert output.token == EXISTING_TOKEN
+    assert consul_client.acl.info.call_args_list == [call(EXISTING_TOKEN)]
+    consul_client.acl.list.assert_not_called()
+    consul_client.acl.update.assert_not_called()
+    consul_client.acl.create.assert_not_called()
+
+
+def test_set_acl_with_known_token_updates_changed_rules(consul_client):
+    consul_client.acl.update.return_value = EXISTING_TOKEN
+    rules = _rules(Rule("key", "read", "foo"))
+
+    output = set_acl(consul_client, Configuration(rules=rules, token_type=CLIENT_TOKEN_TYPE_VALUE,
+                                                  token=EXISTING_TOKEN))
+
+    assert output.operation == UPDATE_OPERATION
+    assert output.changed is True
+    consul_client.acl.list.assert_not_called()
+    consul_client.acl.update.assert_called_once_with(
+        EXISTING_TOKEN, name=EXISTING_NAME, type=CLIENT_TOKEN_TYPE_VALUE, rules='key "foo" {\n  policy = "read"\n}\n')
+
+
+def test_set_acl_with_unknown_token_creates(consul_client):
+    output = set_acl(consul_client, _configuration(token="unknown-token", name="new-name"))
+
+    assert output.operation == CREATE_OPERATION
+    assert output.changed is True
+    assert output.token == "new-token"
+    assert consul_client.acl.method_calls == [
+        call.info("unknown-token"),
+        call.list(),
+        call.create(name="new-name", type=CLIENT_TOKEN_TYPE_VALUE, rules=None, acl_id="unknown-token"),
+    ]
+
+
+def test_set_acl_with_name_resolves_token_from_list(consul_client):
+    configuration = _configuration(name=EXISTING_NAME)
+
+    output = set_acl(consul_client, configuration)
+
+    assert output.operation == UPDATE_OPERATION
+    assert output.changed is False
+    assert output.token == EXISTING_TOKEN
+    assert configuration.token == EXISTING_TOKEN
+    assert consul_client.acl.method_calls == [call.list()]
+
+
+def test_set_acl_with_unknown_token_and_existing_name_fails(consul_client):
+    with pytest.raises(AssertionError):
+        set_acl(consul_client, _configuration(token="unknown-token", name=EXISTING_NAME))
+
+    assert consul_client.acl.method_calls == [call.info("unknown-token"), call.list()]
+
+
+def test_rule_collection_equality_ignores_order():
+    assert _rules(Rule("key", "read", "foo"), Rule("keyring", "write")) \
+        == _rules(Rule("keyring", "write"), Rule("key", "read", "foo"))
+
+
+def test_rule_collection_equality_detects_changed_policy():
+    assert _rules(Rule("key", "read", "foo"), Rule("keyring", "write")) \
+        != _rules(Rule("key", "deny", "foo"), Rule("keyring", "write"))